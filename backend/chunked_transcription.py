@@ -2,18 +2,56 @@
 """
 Chunked transcription with real progress tracking
 """
+import os
+import tempfile
 import librosa
 import numpy as np
+import soundfile as sf
 import asyncio
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+# RAM-backed tempdir when the platform provides one: scratch WAVs never
+# touch disk (None falls back to the platform default)
+_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+def _pack_speech_chunks(speech_segments: List[Tuple[float, float]],
+                        chunk_size: float) -> List[Tuple[float, float]]:
+    """
+    Greedily pack contiguous speech segments into chunks of at most
+    chunk_size seconds, so chunk boundaries fall on silence instead of
+    cutting words. Silence between chunks is dropped entirely.
+    """
+    chunks = []
+    cur_start = cur_end = None
+
+    for start, end in speech_segments:
+        if cur_start is None:
+            cur_start, cur_end = start, end
+        elif end - cur_start <= chunk_size:
+            cur_end = end
+        else:
+            chunks.append((cur_start, cur_end))
+            cur_start, cur_end = start, end
+
+        # Split single speech runs longer than chunk_size
+        while cur_end - cur_start > chunk_size:
+            chunks.append((cur_start, cur_start + chunk_size))
+            cur_start += chunk_size
+
+    if cur_start is not None and cur_end > cur_start:
+        chunks.append((cur_start, cur_end))
+
+    return chunks
 
 async def transcribe_with_progress(
-    asr_engine, 
-    audio_path: str, 
+    asr_engine,
+    audio_path: str,
     language: Optional[str],
     manager,
     job_id: str,
-    chunk_size: int = 30  # seconds per chunk
+    chunk_size: int = 30,  # seconds per chunk
+    max_workers: Optional[int] = None  # parallel chunk workers
 ):
     """
     Transcribe audio in chunks with real progress updates
@@ -65,58 +103,100 @@ async def transcribe_with_progress(
             })
             
             return result
-        
-        # Process in chunks
-        full_text = ""
-        all_segments = []
-        
-        for chunk_idx in range(total_chunks):
-            start_sample = chunk_idx * chunk_samples
-            end_sample = min((chunk_idx + 1) * chunk_samples, len(audio))
-            
-            # Progress calculation
-            base_progress = 15 + (chunk_idx / total_chunks) * 70  # 15% to 85%
-            
-            await manager.broadcast({
-                "type": "transcribe_progress",
-                "job_id": job_id,
-                "status": "transcribing",
-                "progress": int(base_progress),
-                "message": f"チャンク {chunk_idx + 1}/{total_chunks} を処理中..."
-            })
-            
-            # Save chunk to temporary file
-            import tempfile
-            import soundfile as sf
-            
+
+        # Prefer VAD-bounded variable-length chunks: boundaries land on
+        # silence (no mid-word cuts) and silent stretches are skipped
+        chunk_ranges = []
+        try:
+            from audio_enhancement import AudioEnhancer
+            speech_segments = AudioEnhancer().detect_speech_segments_from_array(audio, sr)
+            chunk_ranges = _pack_speech_chunks(speech_segments, chunk_size)
+        except Exception as e:
+            print(f"VAD chunking failed: {e}, using fixed-size chunks")
+
+        if not chunk_ranges:
+            # Fallback: fixed-size chunks over the whole file
+            chunk_ranges = [
+                (i * chunk_size, min((i + 1) * chunk_size, duration))
+                for i in range(total_chunks)
+            ]
+        total_chunks = len(chunk_ranges)
+
+        # Process chunks through a bounded worker pool so multiple cores /
+        # GPU streams stay busy instead of running strictly sequentially
+        workers = max_workers or min(4, os.cpu_count() or 1)
+        loop = asyncio.get_event_loop()
+        sem = asyncio.Semaphore(workers)
+        completed = 0
+
+        # Engines expose transcribe_array for in-memory buffers; fall back to a
+        # temp-file round-trip only for engines that don't (e.g. test doubles)
+        transcribe_array = getattr(asr_engine, "transcribe_array", None)
+
+        def _run_chunk(chunk_idx: int):
+            """Transcribe one chunk slice (worker thread)"""
+            start_time, end_time = chunk_ranges[chunk_idx]
+            start_sample = int(start_time * sr)
+            end_sample = min(int(end_time * sr), len(audio))
             chunk_audio = audio[start_sample:end_sample]
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+
+            if transcribe_array is not None:
+                # Zero-copy ndarray view - no WAV encode/decode per chunk
+                result = transcribe_array(chunk_audio, sr, language, return_segments=True)
+                return start_time, result
+
+            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False,
+                                             dir=_TMP_DIR) as tmp_file:
                 sf.write(tmp_file.name, chunk_audio, sr)
                 chunk_path = tmp_file.name
-            
+
             try:
-                # Transcribe chunk
-                chunk_result = asr_engine.transcribe(chunk_path, language, return_segments=True)
-                
-                if chunk_result and 'text' in chunk_result:
-                    full_text += chunk_result['text'] + " "
-                    
-                if chunk_result and 'segments' in chunk_result:
-                    # Adjust segment timestamps for chunk offset
-                    time_offset = start_sample / sr
-                    for segment in chunk_result['segments']:
-                        segment['start'] += time_offset
-                        segment['end'] += time_offset
-                    all_segments.extend(chunk_result['segments'])
-                    
+                result = asr_engine.transcribe(chunk_path, language, return_segments=True)
+                return start_time, result
             finally:
-                # Clean up temporary file
-                import os
                 try:
                     os.unlink(chunk_path)
                 except:
                     pass
-        
+
+        async def _worker(chunk_idx: int):
+            nonlocal completed
+            async with sem:
+                time_offset, chunk_result = await loop.run_in_executor(
+                    executor, _run_chunk, chunk_idx
+                )
+
+            # Progress reflects completed/total, regardless of finish order
+            completed += 1
+            await manager.broadcast({
+                "type": "transcribe_progress",
+                "job_id": job_id,
+                "status": "transcribing",
+                "progress": int(15 + (completed / total_chunks) * 70),  # 15% to 85%
+                "message": f"チャンク {completed}/{total_chunks} を処理中..."
+            })
+            return time_offset, chunk_result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            tasks = [asyncio.create_task(_worker(i)) for i in range(total_chunks)]
+            chunk_results = await asyncio.gather(*tasks)
+
+        # Combine in chunk order (gather preserves task order)
+        full_text = ""
+        all_segments = []
+
+        for time_offset, chunk_result in chunk_results:
+            if chunk_result and 'text' in chunk_result:
+                full_text += chunk_result['text'] + " "
+
+            if chunk_result and 'segments' in chunk_result:
+                # Adjust segment timestamps for chunk offset
+                for segment in chunk_result['segments']:
+                    segment['start'] += time_offset
+                    segment['end'] += time_offset
+                all_segments.extend(chunk_result['segments'])
+
+
         # Final processing
         await manager.broadcast({
             "type": "transcribe_progress",
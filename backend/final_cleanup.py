@@ -3,22 +3,67 @@
 Final cleanup of renderer.js - remove all duplicate event handlers
 """
 
-def clean_renderer():
-    renderer_path = "/Users/ktsutsum/Documents/claude/web-whisper-mw/electron/src/renderer/renderer.js"
-    
-    with open(renderer_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
+def _remove_onclick_statements_ast(source):
+    """
+    Remove top-level `X.onclick = ...` statements via an esprima AST pass.
+
+    Parsing is a single linear scan and stays correct when braces appear
+    inside strings, comments, regex or template literals - all cases the
+    line-based brace counter miscounts. Handlers inside
+    initializeEventHandlers are nested nodes, not top-level statements,
+    so they survive untouched. Returns the cleaned source, or None when
+    esprima is unavailable or the file doesn't parse.
+    """
+    try:
+        import esprima
+    except ImportError:
+        return None
+
+    try:
+        tree = esprima.parseScript(source, {'range': True, 'tolerant': True})
+    except Exception as e:
+        print(f"esprima parse failed: {e}")
+        return None
+
+    # Collect source ranges of standalone onclick assignments
+    spans = []
+    for node in tree.body:
+        if node.type != 'ExpressionStatement':
+            continue
+        expr = node.expression
+        if (expr.type == 'AssignmentExpression'
+                and expr.left.type == 'MemberExpression'
+                and getattr(expr.left.property, 'name', None) == 'onclick'):
+            spans.append(tuple(node.range))
+
+    if not spans:
+        return source
+
+    # Splice the ranges out by slicing so surrounding formatting is kept
+    # (no escodegen round-trip needed)
+    out = []
+    pos = 0
+    for start, end in spans:
+        out.append(source[pos:start])
+        while end < len(source) and source[end] in ' \t':
+            end += 1
+        if end < len(source) and source[end] == '\n':
+            end += 1
+        pos = end
+    out.append(source[pos:])
+    return ''.join(out)
+
+def _clean_renderer_lines(lines):
+    """Line-based fallback cleanup using brace counting"""
     # Track if we're inside initializeEventHandlers function
     inside_init_function = False
     init_brace_count = 0
     cleaned_lines = []
-    skip_lines = False
-    
+
     i = 0
     while i < len(lines):
         line = lines[i].rstrip()
-        
+
         # Check if we're entering initializeEventHandlers function
         if "function initializeEventHandlers() {" in line:
             inside_init_function = True
@@ -26,7 +71,7 @@ def clean_renderer():
             cleaned_lines.append(lines[i])
             i += 1
             continue
-        
+
         # If inside initializeEventHandlers, track braces
         if inside_init_function:
             init_brace_count += line.count('{') - line.count('}')
@@ -35,39 +80,50 @@ def clean_renderer():
                 inside_init_function = False
             i += 1
             continue
-        
+
         # Skip standalone event handlers outside initializeEventHandlers
         if "$(" in line and ".onclick" in line and not inside_init_function:
             # Skip this event handler block
-            skip_lines = True
             # Find the end of this event handler (look for }; or };)
             brace_count = line.count('{') - line.count('}')
             i += 1
-            
+
             while i < len(lines) and (brace_count > 0 or not lines[i].strip().endswith('};')):
                 brace_count += lines[i].count('{') - lines[i].count('}')
                 i += 1
-            
+
             # Skip the closing line as well
             if i < len(lines):
                 i += 1
             continue
-        
+
         # Skip recording functionality and other standalone blocks
         if line.startswith("// Recording functionality"):
             # Skip until next function or major section
             while i < len(lines) and not (lines[i].startswith("function ") or lines[i].startswith("// ") and "function" in lines[i]):
                 i += 1
             continue
-            
+
         cleaned_lines.append(lines[i])
         i += 1
-    
+
+    return cleaned_lines
+
+def clean_renderer():
+    renderer_path = "/Users/ktsutsum/Documents/claude/web-whisper-mw/electron/src/renderer/renderer.js"
+
+    with open(renderer_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    cleaned = _remove_onclick_statements_ast(source)
+    if cleaned is None:
+        cleaned = ''.join(_clean_renderer_lines(source.splitlines(keepends=True)))
+
     # Write cleaned content
     with open(renderer_path, 'w', encoding='utf-8') as f:
-        f.writelines(cleaned_lines)
-    
+        f.write(cleaned)
+
     print(f"Cleaned renderer.js - removed standalone event handlers")
 
 if __name__ == "__main__":
-    clean_renderer()
\ No newline at end of file
+    clean_renderer()
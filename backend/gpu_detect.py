@@ -1,6 +1,44 @@
 # backend/gpu_detect.py
-import sys, platform, subprocess
+import sys, os, glob, platform, subprocess, time, functools
 
+# GPU topology is effectively static for the life of the process, but the
+# UI polls these probes on every health check. Cache results briefly; the
+# short TTL still picks up hotplug/driver changes eventually.
+_PROBE_TTL = 60.0  # seconds
+
+def _ttl_cache(func):
+    """Cache a zero-argument probe's result for _PROBE_TTL seconds"""
+    state = {"value": None, "at": -_PROBE_TTL}
+
+    @functools.wraps(func)
+    def wrapper():
+        now = time.monotonic()
+        if now - state["at"] >= _PROBE_TTL:
+            state["value"] = func()
+            state["at"] = now
+        return state["value"]
+
+    return wrapper
+
+# torch / onnxruntime imports can cost 500ms-2s cold; do each at most once
+_torch = None
+_ort = None
+
+def _get_torch():
+    global _torch
+    if _torch is None:
+        import torch
+        _torch = torch
+    return _torch
+
+def _get_onnxruntime():
+    global _ort
+    if _ort is None:
+        import onnxruntime
+        _ort = onnxruntime
+    return _ort
+
+@_ttl_cache
 def get_gpu_info():
     """Get detailed GPU information for backend selection"""
     info = {
@@ -19,11 +57,131 @@ def get_gpu_info():
     
     return info
 
+# PCI vendor IDs reported by DXGI; 0x1414 is Microsoft's software adapter
+_PCI_VENDOR_TYPES = {
+    0x10DE: ("NVIDIA", "nvidia"),
+    0x1002: ("AMD", "amd"),
+    0x1022: ("AMD", "amd"),
+    0x8086: ("Intel", "intel"),
+}
+
+def _dxgi_enum_adapters():
+    """
+    Enumerate GPU adapters in-process via DXGI (Windows only)
+
+    One COM call instead of spawning wmic.exe (deprecated on Win11 and
+    ~1s cold) plus CSV parsing. Raises OSError when dxgi.dll is missing.
+    """
+    import ctypes
+
+    class LUID(ctypes.Structure):
+        _fields_ = [("LowPart", ctypes.c_uint32), ("HighPart", ctypes.c_int32)]
+
+    class DXGI_ADAPTER_DESC1(ctypes.Structure):
+        _fields_ = [
+            ("Description", ctypes.c_wchar * 128),
+            ("VendorId", ctypes.c_uint32),
+            ("DeviceId", ctypes.c_uint32),
+            ("SubSysId", ctypes.c_uint32),
+            ("Revision", ctypes.c_uint32),
+            ("DedicatedVideoMemory", ctypes.c_size_t),
+            ("DedicatedSystemMemory", ctypes.c_size_t),
+            ("SharedSystemMemory", ctypes.c_size_t),
+            ("AdapterLuid", LUID),
+            ("Flags", ctypes.c_uint32),
+        ]
+
+    class GUID(ctypes.Structure):
+        _fields_ = [
+            ("Data1", ctypes.c_uint32),
+            ("Data2", ctypes.c_uint16),
+            ("Data3", ctypes.c_uint16),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+
+    iid_factory1 = GUID(0x770aae78, 0xf26f, 0x4dba,
+                        (ctypes.c_ubyte * 8)(0xa8, 0x29, 0x25, 0x3c, 0x83, 0xd1, 0xb3, 0x87))
+
+    def _method(obj, index, *argtypes):
+        # COM methods live in the object's vtable; first arg is `this`
+        vtbl = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+        proto = ctypes.WINFUNCTYPE(ctypes.c_int32, ctypes.c_void_p, *argtypes)
+        return proto(vtbl[index])
+
+    dxgi = ctypes.windll.dxgi
+    factory = ctypes.c_void_p()
+    hr = dxgi.CreateDXGIFactory1(ctypes.byref(iid_factory1), ctypes.byref(factory))
+    if hr != 0:
+        raise OSError(f"CreateDXGIFactory1 failed: 0x{hr & 0xFFFFFFFF:08x}")
+
+    DXGI_ERROR_NOT_FOUND = 0x887A0002
+    enum_adapters1 = _method(factory, 12, ctypes.c_uint32,
+                             ctypes.POINTER(ctypes.c_void_p))  # IDXGIFactory1::EnumAdapters1
+
+    adapters = []
+    try:
+        index = 0
+        while True:
+            adapter = ctypes.c_void_p()
+            hr = enum_adapters1(factory, index, ctypes.byref(adapter))
+            if hr & 0xFFFFFFFF == DXGI_ERROR_NOT_FOUND or hr != 0:
+                break
+            try:
+                desc = DXGI_ADAPTER_DESC1()
+                get_desc1 = _method(adapter, 10,
+                                    ctypes.POINTER(DXGI_ADAPTER_DESC1))  # IDXGIAdapter1::GetDesc1
+                if get_desc1(adapter, ctypes.byref(desc)) == 0:
+                    adapters.append({
+                        "name": desc.Description,
+                        "vendor_id": desc.VendorId,
+                        "vram": int(desc.DedicatedVideoMemory),
+                    })
+            finally:
+                _method(adapter, 2)(adapter)  # IUnknown::Release
+            index += 1
+    finally:
+        _method(factory, 2)(factory)
+
+    return adapters
+
 def get_windows_gpu_info():
+    """Get Windows GPU information via DXGI, falling back to wmic"""
+    try:
+        adapters = _dxgi_enum_adapters()
+    except OSError:
+        return _get_windows_gpu_info_wmic()
+    except Exception as e:
+        print(f"DXGI GPU detection failed: {e}")
+        return _get_windows_gpu_info_wmic()
+
+    gpus = []
+    for adapter in adapters:
+        if adapter["vendor_id"] == 0x1414:
+            continue  # Microsoft Basic Render Driver (software)
+        vendor, gpu_type = _PCI_VENDOR_TYPES.get(adapter["vendor_id"],
+                                                  ("Unknown", "unknown"))
+        gpus.append({
+            "name": adapter["name"],
+            "vendor": vendor,
+            "type": gpu_type,
+            "vram": adapter["vram"],
+        })
+
+    return {"gpus": gpus, "recommended_backend": _recommend_windows_backend(gpus)}
+
+def _recommend_windows_backend(gpus):
+    """Pick the backend for a list of classified Windows GPUs"""
+    if any(gpu["type"] == "nvidia" for gpu in gpus):
+        return "ctranslate2"  # CUDA
+    if any(gpu["type"] in ("amd", "intel") for gpu in gpus):
+        return "directml"  # DirectML for AMD/Intel
+    return "cpu"
+
+def _get_windows_gpu_info_wmic():
     """Get Windows GPU information using wmic"""
     gpus = []
     recommended = "cpu"
-    
+
     try:
         # Query GPU information
         result = subprocess.run([
@@ -58,21 +216,11 @@ def get_windows_gpu_info():
                         }
                         gpus.append(gpu_info)
         
-        # Determine recommended backend
-        nvidia_found = any(gpu["type"] == "nvidia" for gpu in gpus)
-        amd_found = any(gpu["type"] == "amd" for gpu in gpus)
-        intel_found = any(gpu["type"] == "intel" for gpu in gpus)
-        
-        if nvidia_found:
-            recommended = "ctranslate2"  # CUDA
-        elif amd_found or intel_found:
-            recommended = "directml"  # DirectML for AMD/Intel
-        else:
-            recommended = "cpu"
-    
+        recommended = _recommend_windows_backend(gpus)
+
     except Exception as e:
         print(f"GPU detection failed: {e}")
-    
+
     return {"gpus": gpus, "recommended_backend": recommended}
 
 def get_macos_gpu_info():
@@ -116,11 +264,56 @@ def get_macos_gpu_info():
     
     return {"gpus": gpus, "recommended_backend": recommended}
 
+def _drm_enum_gpus():
+    """
+    Enumerate GPUs from /sys/class/drm sysfs entries (Linux only)
+
+    Plain file reads in microseconds versus fork+exec of lspci plus its
+    PCI ID database parse; the vendor ID is authoritative, so no name
+    keyword matching is needed.
+    """
+    gpus = []
+    for dev in sorted(glob.glob("/sys/class/drm/card[0-9]*/device")):
+        try:
+            with open(os.path.join(dev, "vendor")) as f:
+                vendor_id = int(f.read().strip(), 16)
+            with open(os.path.join(dev, "device")) as f:
+                device_id = int(f.read().strip(), 16)
+        except (OSError, ValueError):
+            continue
+        vendor, gpu_type = _PCI_VENDOR_TYPES.get(vendor_id, ("Unknown", "unknown"))
+        gpus.append({
+            "name": f"{vendor} GPU [{vendor_id:04x}:{device_id:04x}]",
+            "vendor": vendor,
+            "type": gpu_type,
+        })
+    return gpus
+
 def get_linux_gpu_info():
+    """Get Linux GPU information from sysfs, falling back to lspci"""
+    try:
+        gpus = _drm_enum_gpus()
+    except Exception as e:
+        print(f"sysfs GPU detection failed: {e}")
+        gpus = []
+
+    if not gpus:
+        return _get_linux_gpu_info_lspci()
+
+    if any(gpu["type"] == "nvidia" for gpu in gpus):
+        recommended = "ctranslate2"
+    elif any(gpu["type"] == "amd" for gpu in gpus):
+        recommended = "directml"  # If available on Linux
+    else:
+        recommended = "ctranslate2"  # CPU fallback
+
+    return {"gpus": gpus, "recommended_backend": recommended}
+
+def _get_linux_gpu_info_lspci():
     """Get Linux GPU information using lspci"""
     gpus = []
     recommended = "cpu"
-    
+
     try:
         result = subprocess.run(["lspci"], capture_output=True, text=True, timeout=10)
         if result.returncode == 0:
@@ -165,20 +358,20 @@ def classify_gpu(gpu_name: str) -> str:
     else:
         return "unknown"
 
+@_ttl_cache
 def check_directml_support():
     """Check if DirectML is available"""
     try:
-        import onnxruntime as ort
-        providers = ort.get_available_providers()
+        providers = _get_onnxruntime().get_available_providers()
         return 'DmlExecutionProvider' in providers
     except:
         return False
 
+@_ttl_cache
 def check_cuda_support():
     """Check if CUDA is available"""
     try:
-        import torch
-        return torch.cuda.is_available()
+        return _get_torch().cuda.is_available()
     except:
         return False
 
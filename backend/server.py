@@ -1,17 +1,94 @@
 # backend/server.py
 import os, tempfile
+import asyncio
+import functools
+import heapq
+import itertools
+import shutil
+import time
+import uuid
+import subprocess
+import soundfile as sf
 from pathlib import Path
 from fastapi import FastAPI, UploadFile, Form, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import json
+import logging
+import logging.handlers
+import queue
+
+logger = logging.getLogger(__name__)
+
+def _setup_logging():
+    """
+    Route log records through a queue drained by a worker thread
+
+    logger.* becomes a lock-free-ish enqueue; the actual write(2) to
+    stdout happens on the listener thread, so heavy log output never
+    blocks the event loop (stdout can stall in containers/pipes).
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    return listener
+
+_log_listener = _setup_logging()
+
+# uvloop roughly doubles event-loop throughput, which shows up directly
+# in WebSocket burst latency. Linux/macOS only - on Windows (or when
+# not installed) asyncio's default loop is used
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# msgspec/orjson serialize in one C call, several times faster than
+# stdlib json; prefer msgspec's reusable encoder, fall back transparently
+try:
+    import msgspec.json
+    _MSGSPEC_ENCODER = msgspec.json.Encoder()
+    def _json_dumps(obj) -> str:
+        return _MSGSPEC_ENCODER.encode(obj).decode()
+except ImportError:
+    try:
+        import orjson
+        def _json_dumps(obj) -> str:
+            return orjson.dumps(obj).decode()
+    except ImportError:
+        def _json_dumps(obj) -> str:
+            return json.dumps(obj)
 from engine import pick_backend, LANG
-from subtitles import segments_to_srt, segments_to_vtt, segments_to_txt
-from streaming import StreamingProcessor
-from audio_enhancement import enhance_audio_file
+from subtitles import (segments_to_srt, segments_to_vtt, segments_to_txt,
+                       iter_srt, iter_vtt, iter_txt)
+
+# Subtitle format dispatch: (joiner for auto-save, streaming iterator,
+# media type, file extension). One table instead of a repeated
+# check/convert/save/respond cascade per format.
+FORMAT_TABLE = {
+    "srt": (segments_to_srt, iter_srt, "text/plain", ".srt"),
+    "vtt": (segments_to_vtt, iter_vtt, "text/vtt", ".vtt"),
+    "txt": (segments_to_txt, iter_txt, "text/plain", ".txt"),
+}
+from streaming import AudioChunker, StreamingProcessor
+from audio_enhancement import enhance_audio_file_async
+from chunked_transcription import transcribe_with_progress
+import gpu_detect
 
 PORT = int(os.getenv("PORT", "8765"))
 
+# WebSocket connection limits: an unbounded connection dict grows without
+# limit under reconnect storms, and dead clients that never close keep
+# their buffers alive forever
+MAX_WS_CONNECTIONS = int(os.getenv("MAX_WS_CONNECTIONS", "1000"))
+WS_IDLE_TTL = float(os.getenv("WS_IDLE_TTL", "300"))  # seconds without a message
+
 # ユーザーのホームディレクトリベースの保存先を設定
 import platform
 from pathlib import Path
@@ -47,6 +124,28 @@ def get_default_save_dir():
 
 OUTPUT_DIR = get_default_save_dir()
 
+@functools.lru_cache(maxsize=64)
+def _fast_duration_cached(path: str, mtime_ns: int, size: int) -> float:
+    try:
+        return sf.info(path).duration
+    except Exception:
+        # Containers soundfile can't parse (e.g. webm): ask ffprobe for the
+        # format duration - still header-only, no decode
+        return float(subprocess.check_output(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'csv=p=0', path]))
+
+def fast_duration(path: str) -> float:
+    """
+    Audio duration read from the container header
+
+    librosa.get_duration decodes the stream to count samples - O(filesize)
+    for a number that sits in the header. Memoized per (path, mtime, size)
+    so repeated probes of the same temp file are free.
+    """
+    st = os.stat(path)
+    return _fast_duration_cached(path, st.st_mtime_ns, st.st_size)
+
 app = FastAPI(title="Whisper Local ASR")
 app.add_middleware(
     CORSMiddleware,
@@ -63,23 +162,158 @@ class ConnectionManager:
     """WebSocket connection manager"""
     def __init__(self):
         self.active_connections: dict[str, WebSocket] = {}
-        
-    async def connect(self, websocket: WebSocket, client_id: str):
+        # job_id -> set of client_ids that asked for that job's updates
+        self.job_subscribers: dict[str, set[str]] = {}
+        # client_id -> monotonic time of the last received message
+        self.last_seen: dict[str, float] = {}
+        # client_id -> bounded priority queue of encoded frames + writer task
+        self.send_queues: dict[str, asyncio.PriorityQueue] = {}
+        self.writer_tasks: dict[str, asyncio.Task] = {}
+        # Tie-breaker so equal-priority frames stay in send order
+        self._seq = itertools.count()
+        self._reaper_task = None
+
+    async def connect(self, websocket: WebSocket, client_id: str) -> bool:
+        if len(self.active_connections) >= MAX_WS_CONNECTIONS:
+            # 1013: Try Again Later - reject instead of growing unbounded
+            await websocket.close(code=1013)
+            return False
+
         await websocket.accept()
         self.active_connections[client_id] = websocket
-        
+        self.last_seen[client_id] = time.monotonic()
+        queue = asyncio.PriorityQueue(maxsize=self.SEND_QUEUE_SIZE)
+        self.send_queues[client_id] = queue
+        self.writer_tasks[client_id] = asyncio.create_task(
+            self._writer(client_id, websocket, queue))
+        if self._reaper_task is None:
+            self._reaper_task = asyncio.create_task(self._reap_idle())
+        return True
+
+    def touch(self, client_id: str):
+        """Record client activity for the idle reaper"""
+        if client_id in self.last_seen:
+            self.last_seen[client_id] = time.monotonic()
+
+    async def _reap_idle(self):
+        """Periodically close connections that went silent for WS_IDLE_TTL"""
+        while True:
+            await asyncio.sleep(30)
+            now = time.monotonic()
+            idle = [cid for cid, seen in self.last_seen.items()
+                    if now - seen > WS_IDLE_TTL]
+            for cid in idle:
+                ws = self.active_connections.get(cid)
+                self.disconnect(cid)
+                if ws is not None:
+                    try:
+                        await ws.close(code=1013)
+                    except Exception:
+                        pass
+
     def disconnect(self, client_id: str):
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+        self.last_seen.pop(client_id, None)
+        self.send_queues.pop(client_id, None)
+        task = self.writer_tasks.pop(client_id, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._unsubscribe_all(client_id)
+
+    def subscribe(self, client_id: str, job_id: str):
+        """Register a client for one job's progress updates"""
+        self.job_subscribers.setdefault(job_id, set()).add(client_id)
+
+    def _unsubscribe_all(self, client_id: str):
+        empty_jobs = []
+        for job_id, subs in self.job_subscribers.items():
+            subs.discard(client_id)
+            if not subs:
+                empty_jobs.append(job_id)
+        for job_id in empty_jobs:
+            del self.job_subscribers[job_id]
             
+    # Per-send timeout: a client that can't drain 2s worth of progress
+    # frames is effectively gone
+    SEND_TIMEOUT = 2.0
+
+    # Frames buffered per connection before old progress ticks get dropped
+    SEND_QUEUE_SIZE = 64
+
+    async def _writer(self, client_id: str, websocket: WebSocket,
+                      queue: asyncio.PriorityQueue):
+        """
+        Drain one connection's send queue
+
+        A single writer per socket serializes its sends, so a slow client
+        backs up only its own bounded queue - producers enqueue and move
+        on instead of awaiting the slowest consumer. Priority ordering
+        means a backlog delivers terminal frames before stale ticks.
+        """
+        try:
+            while True:
+                _, _, payload = await queue.get()
+                try:
+                    await asyncio.wait_for(websocket.send_text(payload),
+                                           timeout=self.SEND_TIMEOUT)
+                except (WebSocketDisconnect, asyncio.TimeoutError,
+                        RuntimeError) as e:
+                    logger.info("Dropping client %s after send failure: %s",
+                                client_id, type(e).__name__)
+                    self.disconnect(client_id)
+                    return
+        except asyncio.CancelledError:
+            pass
+
+    @staticmethod
+    def _frame_priority(message: dict) -> int:
+        """Classify a frame: 0=terminal, 1=status change, 2=percent tick"""
+        data = message.get("data") if isinstance(message.get("data"), dict) else {}
+        status = message.get("status") or data.get("status")
+        if status in ("completed", "error", "cancelled"):
+            return 0
+        if "progress" in message or "progress" in data:
+            return 2
+        return 1
+
+    def _enqueue(self, client_id: str, payload: str, prio: int):
+        queue = self.send_queues.get(client_id)
+        if queue is None:
+            return
+        entry = (prio, next(self._seq), payload)
+        try:
+            queue.put_nowait(entry)
+            return
+        except asyncio.QueueFull:
+            pass
+        # Queue full: evict a disposable percent tick (prio 2) to make
+        # room - it's stale the moment a newer frame exists. Terminal and
+        # status-change frames are never dropped once queued.
+        heap = queue._queue
+        for idx, queued in enumerate(heap):
+            if queued[0] == 2:
+                heap[idx] = heap[-1]
+                heap.pop()
+                heapq.heapify(heap)
+                queue.put_nowait(entry)
+                return
+        if prio < 2:
+            logger.warning("Send queue full for %s; dropping frame", client_id)
+
+    async def _send_raw(self, client_id: str, payload: str, prio: int = 1):
+        """
+        Transport layer: queue an already-encoded frame for one client
+
+        Callers fanning the same message out in a loop encode once and
+        call this per client instead of re-serializing per send.
+        """
+        self._enqueue(client_id, payload, prio)
+
     async def send_personal_message(self, message: dict, client_id: str):
-        if client_id in self.active_connections:
-            try:
-                await self.active_connections[client_id].send_text(json.dumps(message))
-            except:
-                # Connection closed, remove it
-                self.disconnect(client_id)
-                
+        await self._send_raw(client_id, _json_dumps(message),
+                             self._frame_priority(message))
+
     async def send_progress_update(self, job_id: str, progress_data: dict):
         """Send progress update to all clients interested in this job"""
         message = {
@@ -87,38 +321,89 @@ class ConnectionManager:
             "job_id": job_id,
             "data": progress_data
         }
-        
-        # Send to all connected clients (in real implementation, 
-        # you might want to track which clients are interested in which jobs)
-        disconnected_clients = []
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except:
-                disconnected_clients.append(client_id)
-                
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
-    
+
+        # Target only the job's subscribers: N clients x M updates no longer
+        # costs N*M sends. Jobs nobody subscribed to fall back to broadcast
+        # so clients that never send subscribe_job keep working.
+        subscribers = self.job_subscribers.get(job_id)
+        await self._fan_out(_json_dumps(message),
+                            self._frame_priority(message), subscribers)
+
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        disconnected_clients = []
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except:
-                disconnected_clients.append(client_id)
-                
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+        """Broadcast message to all connected clients (global events only)"""
+        await self._fan_out(_json_dumps(message), self._frame_priority(message))
+
+    async def _fan_out(self, payload: str, prio: int, client_ids=None):
+        """
+        Enqueue an encoded payload for the target connections' writers
+
+        client_ids limits delivery to those clients; None means everyone.
+        Enqueueing never blocks, so fan-out cost is O(subscribers) dict
+        work regardless of how slow any individual socket is; send
+        failures are handled by each connection's writer task.
+        """
+        if client_ids is None:
+            targets = list(self.send_queues)
+        else:
+            targets = [cid for cid in client_ids if cid in self.send_queues]
+        for client_id in targets:
+            await self._send_raw(client_id, payload, prio)
 
 manager = ConnectionManager()
 
 # Set the WebSocket manager for streaming processor
 streaming_processor.websocket_manager = manager
 
+# Reusable upload spool files, keyed by suffix (the engines sniff the
+# container format from the file extension). Without the pool every
+# /transcribe call creates and unlinks a fresh tempfile; rewinding a
+# pooled one replaces that open/close/unlink inode churn with a
+# seek+truncate.
+TEMP_POOL_SIZE = int(os.getenv("TEMP_POOL_SIZE", "8"))
+_TEMP_POOLS: dict[str, asyncio.Queue] = {}
+
+def _acquire_temp(suffix: str):
+    """Check a rewound spool file out of the pool, creating on miss"""
+    pool = _TEMP_POOLS.setdefault(suffix, asyncio.Queue(maxsize=TEMP_POOL_SIZE))
+    try:
+        tmp = pool.get_nowait()
+        tmp.seek(0)
+        tmp.truncate()
+    except asyncio.QueueEmpty:
+        tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    return tmp
+
+def _release_temp(suffix: str, tmp) -> None:
+    """Return a spool file to its pool; close and unlink when full"""
+    pool = _TEMP_POOLS.setdefault(suffix, asyncio.Queue(maxsize=TEMP_POOL_SIZE))
+    try:
+        pool.put_nowait(tmp)
+    except asyncio.QueueFull:
+        try:
+            tmp.close()
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+
+def _write_unique(save_dir: Path, base_name: str, ext: str, content: str) -> str:
+    """
+    Create "<base_name><ext>" in save_dir and write content, returning the path
+
+    O_CREAT|O_EXCL makes the creation atomic - no stat-then-open race with
+    concurrent saves. If the name is taken, mkstemp picks a free suffixed
+    name in one call instead of counting upward with an exists() loop.
+    """
+    save_path = save_dir / f"{base_name}{ext}"
+    try:
+        fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+    except FileExistsError:
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{base_name}_", suffix=ext,
+                                        dir=str(save_dir))
+        save_path = Path(tmp_name)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return str(save_path)
+
 def auto_save_transcription(filename: str, content: str, format: str, custom_path: str = None) -> str:
     """
     入力ファイル名と同じ名前でテキストファイルを自動保存
@@ -152,56 +437,43 @@ def auto_save_transcription(filename: str, content: str, format: str, custom_pat
     
     # 保存先ディレクトリを決定
     if custom_path:
+        # exist_ok=True なので事前の exists() チェックは不要 (statが1回減る)
         save_dir = Path(custom_path)
-        if not save_dir.exists():
-            try:
-                save_dir.mkdir(parents=True, exist_ok=True)
-            except:
-                print(f"⚠️ カスタムパス作成失敗、デフォルトパスを使用: {OUTPUT_DIR}")
-                save_dir = OUTPUT_DIR
+        try:
+            save_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            logger.warning(f"カスタムパス作成失敗、デフォルトパスを使用: {OUTPUT_DIR}")
+            save_dir = OUTPUT_DIR
     else:
         save_dir = OUTPUT_DIR
     
-    # 保存ファイルパスを生成
-    save_path = save_dir / f"{base_name}{ext}"
-    
-    # 同名ファイルが存在する場合は番号を付加
-    counter = 1
-    original_save_path = save_path
-    while save_path.exists():
-        save_path = save_dir / f"{base_name}_{counter}{ext}"
-        counter += 1
-    
-    # ファイルに保存
+    # ファイルに保存（同名ファイルが存在する場合は一意な名前を生成）
     try:
-        save_path.write_text(content, encoding='utf-8')
-        print(f"✅ 自動保存完了: {save_path}")
-        return str(save_path)
+        saved = _write_unique(save_dir, base_name, ext, content)
+        logger.info(f"自動保存完了: {saved}")
+        return saved
     except Exception as e:
-        print(f"❌ 自動保存エラー: {e}")
+        logger.error(f"自動保存エラー: {e}")
         # フォールバック: デフォルトディレクトリに保存を試行
         if custom_path and save_dir != OUTPUT_DIR:
             try:
-                fallback_path = OUTPUT_DIR / f"{base_name}{ext}"
-                counter = 1
-                while fallback_path.exists():
-                    fallback_path = OUTPUT_DIR / f"{base_name}_{counter}{ext}"
-                    counter += 1
-                fallback_path.write_text(content, encoding='utf-8')
-                print(f"✅ フォールバック保存完了: {fallback_path}")
-                return str(fallback_path)
+                saved = _write_unique(OUTPUT_DIR, base_name, ext, content)
+                logger.info(f"フォールバック保存完了: {saved}")
+                return saved
             except Exception as fallback_error:
-                print(f"❌ フォールバック保存エラー: {fallback_error}")
+                logger.error(f"フォールバック保存エラー: {fallback_error}")
         return ""
 
 @app.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     """WebSocket endpoint for real-time communication"""
-    await manager.connect(websocket, client_id)
+    if not await manager.connect(websocket, client_id):
+        return  # at capacity, rejected with 1013
     try:
         while True:
             # Keep connection alive and handle incoming messages
             data = await websocket.receive_text()
+            manager.touch(client_id)
             message = json.loads(data)
             
             # Handle different message types
@@ -209,25 +481,28 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 await manager.send_personal_message({"type": "pong"}, client_id)
             elif message.get("type") == "subscribe_job":
                 job_id = message.get("job_id")
-                # In a more sophisticated implementation, you'd track job subscriptions
+                if job_id:
+                    manager.subscribe(client_id, job_id)
                 await manager.send_personal_message({
-                    "type": "job_subscribed", 
+                    "type": "job_subscribed",
                     "job_id": job_id
                 }, client_id)
                 
     except WebSocketDisconnect:
         manager.disconnect(client_id)
     except Exception as e:
-        print(f"WebSocket error for client {client_id}: {e}")
+        logger.warning(f"WebSocket error for client {client_id}: {e}")
         manager.disconnect(client_id)
 
 @app.get("/health")
 async def health():
     return {
-        "status": "ok", 
+        "status": "ok",
         "backend": type(asr).__name__,
         "current_model": asr.get_current_model(),
-        "available_models": asr.get_available_models()
+        "available_models": asr.get_available_models(),
+        "compute_type": getattr(asr, "compute_type_used", None),
+        "cached_models": len(getattr(asr, "_model_cache", ()))
     }
 
 @app.post("/transcribe")
@@ -255,17 +530,25 @@ async def transcribe(
     - save_path: Custom save directory path (optional)
     """
     # 一時保存してから処理
+    # Spool the upload to disk with a 1MB bound - copyfileobj drains the
+    # underlying SpooledTemporaryFile in one worker-thread call, so the
+    # event loop never blocks on the write loop and peak memory stays at
+    # one buffer regardless of upload size
     suffix = os.path.splitext(file.filename or "")[1] or ".webm"
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        tmp.write(await file.read())
-        path = tmp.name
+    tmp = _acquire_temp(suffix)
+    await file.seek(0)
+    await asyncio.to_thread(shutil.copyfileobj, file.file, tmp, 1 << 20)
+    tmp.flush()  # the engines read by path while the pooled fd stays open
+    path = tmp.name
 
     try:
-        # Apply audio enhancement if requested
+        # Apply audio enhancement if requested - in a worker thread, so
+        # the decode/STFT/VAD work doesn't stall WebSocket frames and
+        # /health while the file is processed
         enhanced_path = path
         if enable_vad or enable_noise_reduction:
             try:
-                enhanced_path = enhance_audio_file(
+                enhanced_path = await enhance_audio_file_async(
                     input_path=path,
                     enable_vad=enable_vad,
                     enable_noise_reduction=enable_noise_reduction,
@@ -274,7 +557,7 @@ async def transcribe(
                 )
             except Exception as e:
                 # Log enhancement error but continue with original audio
-                print(f"Audio enhancement failed: {e}, using original audio")
+                logger.warning(f"Audio enhancement failed: {e}, using original audio")
                 enhanced_path = path
         
         # Segments が必要な形式かどうかを判定
@@ -285,13 +568,11 @@ async def transcribe(
             language = None
         
         # Generate job ID for progress tracking
-        import uuid
-        import librosa
         job_id = str(uuid.uuid4())[:8]
-        
+
         # Get audio duration to decide processing method
         try:
-            duration = librosa.get_duration(path=enhanced_path)
+            duration = fast_duration(enhanced_path)
         except:
             duration = 60  # Default fallback
         
@@ -306,34 +587,30 @@ async def transcribe(
         
         # Use chunked processing for longer audio (>60 seconds)
         if duration > 60:
-            from chunked_transcription import transcribe_with_progress
             result = await transcribe_with_progress(
                 asr, enhanced_path, language, manager, job_id
             )
         else:
-            # Short audio - use simple progress simulation
-            stages = [
-                (20, "モデルを読み込み中..."),
-                (50, "音声を解析中..."),
-                (80, "文字起こし処理中..."),
-            ]
-            
-            import asyncio
-            for progress, message in stages:
-                await manager.broadcast({
-                    "type": "transcribe_progress",
-                    "job_id": job_id,
-                    "status": "processing",
-                    "progress": progress,
-                    "message": message
-                })
-                await asyncio.sleep(0.2)  # Brief delay for visual effect
-            
-            result = asr.transcribe(enhanced_path, language, return_segments=return_segments)
-            
+            # Short audio - single-shot transcription with real milestones
+            # only (the old simulated stages slept 0.2s x3, a hard 600ms
+            # latency floor on every short request)
             await manager.broadcast({
                 "type": "transcribe_progress",
-                "job_id": job_id, 
+                "job_id": job_id,
+                "status": "transcribing",
+                "progress": 15,
+                "message": "文字起こし処理中..."
+            })
+
+            # Worker thread + per-engine semaphore: the event loop keeps
+            # serving WebSocket updates, and concurrent requests queue
+            # instead of racing inside the shared model
+            result = await asr.transcribe_async(
+                enhanced_path, language, return_segments=return_segments)
+
+            await manager.broadcast({
+                "type": "transcribe_progress",
+                "job_id": job_id,
                 "status": "completed",
                 "progress": 100,
                 "message": "文字起こし完了！"
@@ -341,67 +618,42 @@ async def transcribe(
         
         if format == "text":
             # 自動保存
-            saved_path = auto_save_transcription(file.filename, result["text"], format, save_path)
+            saved_path = await asyncio.to_thread(
+                auto_save_transcription, file.filename, result["text"], format, save_path
+            )
             return JSONResponse({
                 "text": result["text"], 
                 "format": "text",
                 "saved_path": saved_path
             })
         
-        elif format == "srt":
+        elif format in FORMAT_TABLE:
             if "segments" not in result:
                 return JSONResponse(
-                    {"error": "Segments not available for SRT format"}, 
+                    {"error": f"Segments not available for {format.upper()} format"},
                     status_code=400
                 )
-            srt_content = segments_to_srt(result["segments"])
-            # 自動保存
-            saved_path = auto_save_transcription(file.filename, srt_content, format, save_path)
-            return Response(
-                content=srt_content,
-                media_type="text/plain",
-                headers={
-                    "Content-Disposition": f"attachment; filename={file.filename or 'transcription'}.srt",
-                    "X-Saved-Path": saved_path
-                }
-            )
-        
-        elif format == "vtt":
-            if "segments" not in result:
-                return JSONResponse(
-                    {"error": "Segments not available for VTT format"}, 
-                    status_code=400
-                )
-            vtt_content = segments_to_vtt(result["segments"])
-            # 自動保存
-            saved_path = auto_save_transcription(file.filename, vtt_content, format, save_path)
-            return Response(
-                content=vtt_content,
-                media_type="text/vtt",
-                headers={
-                    "Content-Disposition": f"attachment; filename={file.filename or 'transcription'}.vtt",
-                    "X-Saved-Path": saved_path
-                }
-            )
-        
-        elif format == "txt":
-            if "segments" not in result:
-                return JSONResponse(
-                    {"error": "Segments not available for TXT format"}, 
-                    status_code=400
-                )
-            txt_content = segments_to_txt(result["segments"])
-            # 自動保存
-            saved_path = auto_save_transcription(file.filename, txt_content, format, save_path)
-            return Response(
-                content=txt_content,
-                media_type="text/plain",
+            to_fn, iter_fn, media_type, ext = FORMAT_TABLE[format]
+
+            # 自動保存 - join+write run together in a worker thread so the
+            # event loop assembles the response concurrently with the disk
+            # write; the X-Saved-Path header needs the final path, so the
+            # task is awaited right before returning
+            def _join_and_save():
+                return auto_save_transcription(
+                    file.filename, to_fn(result["segments"]), format, save_path)
+
+            save_task = asyncio.create_task(asyncio.to_thread(_join_and_save))
+            body = iter_fn(result["segments"])
+            return StreamingResponse(
+                body,
+                media_type=media_type,
                 headers={
-                    "Content-Disposition": f"attachment; filename={file.filename or 'transcription'}.txt",
-                    "X-Saved-Path": saved_path
+                    "Content-Disposition": f"attachment; filename={file.filename or 'transcription'}{ext}",
+                    "X-Saved-Path": await save_task
                 }
             )
-        
+
         else:
             return JSONResponse(
                 {"error": f"Unsupported format: {format}"}, 
@@ -409,12 +661,9 @@ async def transcribe(
             )
     
     finally:
-        # Clean up temporary files
-        try:
-            os.unlink(path)
-        except:
-            pass
-        
+        # Return the upload spool file to the pool for the next request
+        _release_temp(suffix, tmp)
+
         # Clean up enhanced audio file if different from original
         if 'enhanced_path' in locals() and enhanced_path != path:
             try:
@@ -434,19 +683,28 @@ async def get_supported_formats():
         }
     }
 
-@app.get("/save-config")
-async def get_save_config():
-    """現在の保存設定を取得"""
+def _build_save_config() -> dict:
+    """保存設定を組み立てる (Desktop/Downloads のstatを伴う)"""
+    home = Path.home()
     return {
         "default_save_dir": str(OUTPUT_DIR),
         "platform": platform.system(),
         "available_dirs": {
-            "home": str(Path.home()),
-            "desktop": str(Path.home() / "Desktop") if (Path.home() / "Desktop").exists() else None,
-            "downloads": str(Path.home() / "Downloads") if (Path.home() / "Downloads").exists() else None,
+            "home": str(home),
+            "desktop": str(home / "Desktop") if (home / "Desktop").exists() else None,
+            "downloads": str(home / "Downloads") if (home / "Downloads").exists() else None,
         }
     }
 
+# Computed once at startup: the directories don't change while the app
+# runs, and the UI polls this endpoint - no need to re-stat per request
+SAVE_CONFIG = _build_save_config()
+
+@app.get("/save-config")
+async def get_save_config():
+    """現在の保存設定を取得"""
+    return SAVE_CONFIG
+
 @app.get("/models")
 async def get_models():
     """Get available models and current model"""
@@ -469,12 +727,10 @@ async def switch_model(model_name: str = Form(...)):
 async def get_gpu_info():
     """Get GPU information and backend recommendations"""
     try:
-        from gpu_detect import get_gpu_info, check_directml_support, check_cuda_support
-        
-        info = get_gpu_info()
+        info = gpu_detect.get_gpu_info()
         info.update({
-            "directml_available": check_directml_support(),
-            "cuda_available": check_cuda_support(),
+            "directml_available": gpu_detect.check_directml_support(),
+            "cuda_available": gpu_detect.check_cuda_support(),
             "current_backend": type(asr).__name__
         })
         
@@ -503,15 +759,16 @@ async def transcribe_streaming(
     
     Returns job_id for tracking progress
     """
-    # Save uploaded file temporarily
+    # Save uploaded file temporarily, spooling in 1MB chunks off the
+    # event loop (see /transcribe)
     suffix = os.path.splitext(file.filename or "")[1] or ".webm"
     with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        tmp.write(await file.read())
+        await file.seek(0)
+        await asyncio.to_thread(shutil.copyfileobj, file.file, tmp, 1 << 20)
         path = tmp.name
     
     try:
         # Configure chunker
-        from streaming import AudioChunker
         chunker = AudioChunker(
             chunk_duration=chunk_duration,
             overlap_duration=overlap_duration
@@ -567,34 +824,28 @@ async def get_streaming_result(job_id: str, format: str = "text"):
             status_code=202
         )
     
+    # Heavy payload only materialized once the job is known complete
+    result = streaming_processor.get_job_results(job_id)
+
     try:
         if format == "text":
             return JSONResponse({
-                "text": status.get("full_text", ""),
+                "text": result.get("full_text", ""),
                 "format": "text",
                 "chunks_processed": status.get("total_chunks", 0)
             })
-        
-        elif format in ["srt", "vtt", "txt"]:
-            segments = status.get("combined_segments", [])
+
+        elif format in FORMAT_TABLE:
+            segments = result.get("combined_segments", [])
             if not segments:
                 return JSONResponse(
                     {"error": "No segments available for subtitle format"},
                     status_code=400
                 )
-            
-            if format == "srt":
-                content = segments_to_srt(segments)
-                media_type = "text/plain"
-            elif format == "vtt":
-                content = segments_to_vtt(segments)
-                media_type = "text/vtt"
-            elif format == "txt":
-                content = segments_to_txt(segments)
-                media_type = "text/plain"
-            
+
+            to_fn, _, media_type, _ = FORMAT_TABLE[format]
             return Response(
-                content=content,
+                content=to_fn(segments),
                 media_type=media_type,
                 headers={
                     "Content-Disposition": f"attachment; filename=streaming_transcription.{format}"
@@ -628,4 +879,8 @@ async def list_streaming_jobs():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=PORT)
\ No newline at end of file
+    # permessage-deflate on progress frames: repeated field names and
+    # transcript text compress well on the wire. WS_COMPRESSION=0 turns
+    # it off if CPU ever matters more than bandwidth
+    uvicorn.run(app, host="127.0.0.1", port=PORT,
+                ws_per_message_deflate=os.getenv("WS_COMPRESSION", "1") == "1")
\ No newline at end of file
@@ -11,6 +11,14 @@ import json
 import uuid
 from pathlib import Path
 
+# TTL-bounded job table when cachetools is available: abandoned jobs
+# (client never fetched the result) age out instead of holding their
+# transcripts in RAM forever. Falls back to a plain dict.
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
 class AudioChunker:
     """Audio chunking utility for long audio processing"""
     
@@ -27,72 +35,236 @@ class AudioChunker:
         self.overlap_duration = overlap_duration
         self.sample_rate = sample_rate
     
-    def chunk_audio_file(self, file_path: str) -> Tuple[List[np.ndarray], float]:
+    def chunk_audio_file(self, file_path: str) -> Tuple[List[np.ndarray], float, List[Tuple[float, float]]]:
         """
         Split audio file into overlapping chunks
-        
+
         Returns:
-            Tuple of (chunks, total_duration)
+            Tuple of (chunks, total_duration, timestamps)
         """
         # Load audio
-        audio, sr = librosa.load(file_path, sr=self.sample_rate)
+        audio = self._load_mono(file_path)
+        sr = self.sample_rate
         total_duration = len(audio) / sr
-        
-        chunks = []
+
+        if len(audio) == 0:
+            return [], total_duration, []
+
         chunk_samples = int(self.chunk_duration * self.sample_rate)
         overlap_samples = int(self.overlap_duration * self.sample_rate)
         step_samples = chunk_samples - overlap_samples
-        
-        for start in range(0, len(audio), step_samples):
-            end = min(start + chunk_samples, len(audio))
-            chunk = audio[start:end]
-            
-            # Pad short chunks at the end
-            if len(chunk) < chunk_samples:
-                chunk = np.pad(chunk, (0, chunk_samples - len(chunk)), 'constant')
-            
-            chunks.append(chunk)
-            
-            # Stop if we've reached the end
-            if end >= len(audio):
-                break
-        
-        return chunks, total_duration
+
+        # One zero-initialized (n_chunks, chunk_samples) matrix instead of
+        # a pad+copy allocation per tail chunk: padding falls out of the
+        # zeros, rows are contiguous and ready for batched inference
+        n_chunks = 1 + max(0, -(-(len(audio) - chunk_samples) // step_samples))
+        out = np.zeros((n_chunks, chunk_samples), dtype=np.float32)
+        for i in range(n_chunks):
+            s = i * step_samples
+            e = min(s + chunk_samples, len(audio))
+            out[i, :e - s] = audio[s:e]
+
+        # Timestamps come straight from the chunk indices actually used
+        # above, so they can't drift from the chunking by an off-by-one
+        timestamps = self._timestamps(n_chunks, step_samples / sr, total_duration)
+
+        return list(out), total_duration, timestamps
     
+    def _load_mono(self, file_path: str) -> np.ndarray:
+        """
+        Decode to mono float32 at the target rate
+
+        libsndfile decodes and soxr resamples (SIMD, ~5x faster than
+        librosa's default kaiser_best at equivalent quality); containers
+        libsndfile can't open (e.g. webm) fall back to librosa.load.
+        """
+        try:
+            audio, sr_in = sf.read(file_path, dtype='float32', always_2d=False)
+        except Exception:
+            audio, _ = librosa.load(file_path, sr=self.sample_rate)
+            return audio
+
+        if audio.ndim == 2:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        if sr_in != self.sample_rate:
+            audio = self._resample_block(audio, sr_in)
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
+    def get_total_duration(self, file_path: str) -> float:
+        """Total duration read from the container header (no decode)"""
+        try:
+            return sf.info(file_path).duration
+        except Exception:
+            return librosa.get_duration(path=file_path)
+
+    def _resample_block(self, block: np.ndarray, native_sr: int) -> np.ndarray:
+        try:
+            import soxr
+            return soxr.resample(block, native_sr, self.sample_rate)
+        except ImportError:
+            return librosa.resample(block, orig_sr=native_sr,
+                                    target_sr=self.sample_rate)
+
+    def iter_chunks(self, file_path: str) -> Generator[np.ndarray, None, None]:
+        """
+        Yield overlapping chunks without decoding the whole file first
+
+        sf.blocks streams one native-rate block per chunk, so peak memory
+        is O(chunk_duration) instead of O(total_duration); each block is
+        downmixed and resampled to the target rate on the fly. Containers
+        libsndfile can't open (e.g. webm) fall back to the eager
+        chunk_audio_file path.
+        """
+        try:
+            info = sf.info(file_path)
+        except Exception:
+            chunks, _, _ = self.chunk_audio_file(file_path)
+            yield from chunks
+            return
+
+        native_sr = info.samplerate
+        blocksize = int(self.chunk_duration * native_sr)
+        overlap = int(self.overlap_duration * native_sr)
+        chunk_samples = int(self.chunk_duration * self.sample_rate)
+
+        for block in sf.blocks(file_path, blocksize=blocksize,
+                               overlap=overlap, dtype='float32',
+                               always_2d=False):
+            if block.ndim == 2:
+                block = block.mean(axis=1)
+            if native_sr != self.sample_rate:
+                block = self._resample_block(block, native_sr)
+
+            # Pad short chunks at the end
+            if len(block) < chunk_samples:
+                block = np.pad(block, (0, chunk_samples - len(block)), 'constant')
+
+            yield np.ascontiguousarray(block[:chunk_samples], dtype=np.float32)
+
+    def _timestamps(self, n_chunks: int, step: float,
+                    total_duration: float) -> List[Tuple[float, float]]:
+        """(start, end) per chunk index; step hoisted out of the loop"""
+        return [(i * step, min(i * step + self.chunk_duration, total_duration))
+                for i in range(n_chunks)]
+
     def get_chunk_timestamps(self, total_duration: float) -> List[Tuple[float, float]]:
-        """Get start and end timestamps for each chunk"""
-        timestamps = []
-        
-        chunk_count = int(np.ceil((total_duration - self.overlap_duration) / (self.chunk_duration - self.overlap_duration)))
-        
-        for i in range(chunk_count):
-            start_time = i * (self.chunk_duration - self.overlap_duration)
-            end_time = min(start_time + self.chunk_duration, total_duration)
-            timestamps.append((start_time, end_time))
-        
-        return timestamps
+        """Get start and end timestamps for each chunk (thin back-compat wrapper)"""
+        if total_duration <= 0:
+            return []
+        step = self.chunk_duration - self.overlap_duration
+        # Same count formula as chunk_audio_file (first chunk plus one per
+        # remaining step), so header-only callers agree with the decoder
+        n_chunks = 1 + max(0, int(np.ceil((total_duration - self.chunk_duration) / step)))
+        return self._timestamps(n_chunks, step, total_duration)
 
 class StreamingProcessor:
     """Streaming audio processing with progress tracking"""
     
-    def __init__(self, asr_engine, chunker: AudioChunker = None, websocket_manager=None):
+    def __init__(self, asr_engine, chunker: AudioChunker = None, websocket_manager=None,
+                 max_concurrent: int = None, silence_rms_threshold: float = None):
         self.asr_engine = asr_engine
         self.chunker = chunker or AudioChunker()
-        self.active_jobs = {}  # job_id -> job_info
-        self.executor = ThreadPoolExecutor(max_workers=1)  # Sequential processing
+        # job_id -> job_info; bounded by entry count and TTL so a
+        # long-running server can't accumulate unfetched transcripts.
+        # In-flight processing holds a direct job_info reference, so
+        # eviction only affects status lookups, never a running job
+        if TTLCache is not None:
+            self.active_jobs = TTLCache(
+                maxsize=int(os.getenv("JOB_CACHE_SIZE", "128")),
+                ttl=float(os.getenv("JOB_CACHE_TTL", "3600")))
+        else:
+            self.active_jobs = {}
+        # Chunks whose RMS falls below this are treated as silence and
+        # never reach the ASR engine - the encoder cost is skipped and
+        # Whisper can't hallucinate text from background noise. 0
+        # disables the gate
+        self.silence_rms_threshold = (silence_rms_threshold
+                                      if silence_rms_threshold is not None
+                                      else float(os.getenv("SILENCE_RMS_THRESHOLD", "0.005")))
+        # CTranslate2/faster-whisper release the GIL during inference, so
+        # chunks can run concurrently; STREAMING_CONCURRENCY=1 restores
+        # strictly sequential processing
+        self.max_concurrent = (max_concurrent
+                               or int(os.getenv("STREAMING_CONCURRENCY", "0"))
+                               or min(os.cpu_count() or 1, 4))
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent)
+        # Engines exposing transcribe_batch (faster-whisper's
+        # BatchedInferencePipeline) get one batched call per job instead
+        # of per-chunk calls
+        self._transcribe_batch = getattr(asr_engine, "transcribe_batch", None)
         self.websocket_manager = websocket_manager  # WebSocket manager for real-time updates
-    
+        # Coalescing queue for progress updates - created lazily so it
+        # binds to the running event loop
+        self._update_queue = None
+        self._flusher_task = None
+        # Last full_text sent per job, for delta frames
+        self._last_sent_text = {}
+
+    # Minimum gap between flushed progress frames per burst
+    _FLUSH_INTERVAL = 0.05
+
     async def _send_websocket_update(self, job_id: str):
-        """Send WebSocket update for job progress"""
-        if self.websocket_manager and job_id in self.active_jobs:
-            job_info = self.active_jobs[job_id]
-            await self.websocket_manager.send_progress_update(job_id, {
-                "status": job_info.get("status"),
-                "progress": job_info.get("progress", 0),
-                "current_chunk": job_info.get("current_chunk", 0),
-                "total_chunks": job_info.get("total_chunks", 0),
-                "full_text": job_info.get("full_text", "")
-            })
+        """Queue a WebSocket update for job progress (coalesced)"""
+        if not self.websocket_manager or job_id not in self.active_jobs:
+            return
+
+        if self._update_queue is None:
+            self._update_queue = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._flush_updates())
+        self._update_queue.put_nowait(job_id)
+
+    async def _flush_updates(self):
+        """
+        Drain-and-coalesce progress frames
+
+        Concurrent chunks can finish microseconds apart; sending every
+        snapshot produces one frame per chunk, each carrying the full
+        accumulated text. Progress is monotonic, so draining the queue
+        and sending only the newest snapshot per job delivers the same
+        final state with at most one frame per ~50ms. Snapshots are
+        built here, at flush time, so the full-text join runs once per
+        flush instead of once per chunk completion.
+        """
+        while True:
+            pending = {await self._update_queue.get()}
+            while True:
+                try:
+                    pending.add(self._update_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            for jid in pending:
+                job_info = self.active_jobs.get(jid)
+                if job_info is None:
+                    self._last_sent_text.pop(jid, None)
+                    continue
+                parts = job_info.get("_text_parts")
+                if parts is not None:
+                    job_info["full_text"] = " ".join(t for t in parts if t).strip()
+                payload = {
+                    "status": job_info.get("status"),
+                    "progress": job_info.get("progress", 0),
+                    "current_chunk": job_info.get("current_chunk", 0),
+                    "total_chunks": job_info.get("total_chunks", 0),
+                }
+                # Text is the heavy field: in-flight frames carry only
+                # the appended suffix when the text grew at the end
+                # (text_delta), the full string when an out-of-order
+                # chunk rewrote the middle. Terminal frames always carry
+                # full_text - the renderer's completion handler and any
+                # client that joined mid-job rely on it
+                full_text = job_info.get("full_text", "")
+                last = self._last_sent_text.get(jid, "")
+                if payload["status"] in ("completed", "failed"):
+                    payload["full_text"] = full_text
+                    self._last_sent_text.pop(jid, None)
+                elif full_text != last:
+                    if last and full_text.startswith(last):
+                        payload["text_delta"] = full_text[len(last):]
+                    else:
+                        payload["full_text"] = full_text
+                    self._last_sent_text[jid] = full_text
+                await self.websocket_manager.send_progress_update(jid, payload)
+            await asyncio.sleep(self._FLUSH_INTERVAL)
     
     async def process_streaming(self, file_path: str, language: str = None, 
                               return_segments: bool = False, 
@@ -156,77 +328,138 @@ class StreamingProcessor:
             job_info["status"] = "chunking"
             await self._send_websocket_update(job_id)
             
-            chunks, total_duration = self.chunker.chunk_audio_file(file_path)
+            # Chunk lazily: the header gives the duration and chunk count
+            # up front, the generator decodes one chunk at a time. The
+            # header read touches the filesystem, so it goes off-loop too
+            total_duration = await asyncio.to_thread(
+                self.chunker.get_total_duration, file_path)
             timestamps = self.chunker.get_chunk_timestamps(total_duration)
-            
-            job_info["total_chunks"] = len(chunks)
+
+            job_info["total_chunks"] = len(timestamps)
             job_info["timestamps"] = timestamps
             job_info["total_duration"] = total_duration
-            
-            # Process each chunk
+
+            # Process chunks concurrently, bounded by max_concurrent; a
+            # pre-sized results list keeps chunk order however sends finish
             job_info["status"] = "transcribing"
             await self._send_websocket_update(job_id)
-            all_results = []
-            combined_text = ""
-            
-            for i, (chunk, (start_time, end_time)) in enumerate(zip(chunks, timestamps)):
-                job_info["current_chunk"] = i + 1
-                job_info["progress"] = (i + 1) / len(chunks) * 100
-                
-                # Save chunk to temporary file
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                    # Convert numpy array back to audio file
-                    import soundfile as sf
-                    sf.write(tmp_file.name, chunk, self.chunker.sample_rate)
-                    chunk_path = tmp_file.name
-                
+
+            n = len(timestamps)
+            results: List[Any] = [None] * n
+            # Per-chunk text slots: appended strings join once per
+            # snapshot flush rather than concatenating per chunk
+            texts: List[str] = [""] * n
+            job_info["_text_parts"] = texts
+            enhancement_options = job_info.get("enhancement_options", {})
+            sem = asyncio.Semaphore(self.max_concurrent)
+            loop = asyncio.get_event_loop()
+            completed = 0
+
+            async def _run_chunk(i, chunk, start_time, end_time):
+                nonlocal completed
                 try:
-                    # Get enhancement options from job info
-                    enhancement_options = job_info.get("enhancement_options", {})
-                    
-                    # Process chunk with enhancement
-                    result = await asyncio.get_event_loop().run_in_executor(
-                        self.executor,
-                        self._process_single_chunk,
-                        chunk_path, language, return_segments, enhancement_options
-                    )
-                    
-                    # Adjust timestamps for segments
-                    if return_segments and "segments" in result:
-                        adjusted_segments = []
-                        for seg in result["segments"]:
-                            adjusted_seg = seg.copy()
-                            adjusted_seg["start"] = seg["start"] + start_time
-                            adjusted_seg["end"] = seg["end"] + start_time
-                            adjusted_segments.append(adjusted_seg)
-                        result["segments"] = adjusted_segments
-                    
-                    # Add chunk info
-                    result["chunk_info"] = {
-                        "chunk_id": i,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "chunk_duration": end_time - start_time
-                    }
-                    
-                    all_results.append(result)
-                    combined_text += result.get("text", "") + " "
-                    
-                    # Update job with partial results
-                    job_info["results"] = all_results
-                    job_info["full_text"] = combined_text.strip()
-                    
-                    # Send real-time progress update via WebSocket
-                    await self._send_websocket_update(job_id)
-                    
-                    # Clean up temporary file
-                    os.unlink(chunk_path)
-                    
+                    try:
+                        # The float32 buffer is handed to the engine
+                        # directly, no WAV round trip per chunk
+                        result = await loop.run_in_executor(
+                            self.executor,
+                            self._process_single_chunk_array,
+                            chunk, self.chunker.sample_rate, language,
+                            return_segments, enhancement_options
+                        )
+                    finally:
+                        sem.release()
+
+                    self._finalize_chunk_result(result, i, start_time,
+                                                end_time, return_segments)
+                    results[i] = result
+                    texts[i] = result.get("text", "")
                 except Exception as e:
                     print(f"Error processing chunk {i}: {e}")
                     job_info["error"] = f"Chunk {i} failed: {str(e)}"
-                    continue
-            
+
+                # Update job with partial results (in chunk order)
+                completed += 1
+                job_info["current_chunk"] = completed
+                job_info["progress"] = completed / n * 100
+                job_info["results"] = [r for r in results if r is not None]
+
+                # Send real-time progress update via WebSocket
+                await self._send_websocket_update(job_id)
+
+            # n == 0 (zero-duration upload) takes the task path below,
+            # whose loops simply never run - the batched tail would
+            # divide by n for the progress update
+            use_batched = (
+                n > 0
+                and self._transcribe_batch is not None
+                and not enhancement_options.get("enable_vad")
+                and not enhancement_options.get("enable_noise_reduction")
+            )
+            if use_batched:
+                # One executor call; the engine batches encoder work
+                # across each chunk's VAD segments. Per-chunk enhancement
+                # forces the task path above. Chunks are materialized
+                # here, trading the lazy-memory bound for batching.
+                chunks = await asyncio.to_thread(
+                    lambda: [c for c, _ in zip(self.chunker.iter_chunks(file_path),
+                                               range(n))])
+                # Silence-gated chunks get empty placeholder results and
+                # never enter the batch
+                live = []
+                for i, chunk in enumerate(chunks):
+                    if self._is_silent(chunk):
+                        results[i] = self._empty_result(i, *timestamps[i],
+                                                        return_segments)
+                    else:
+                        live.append(i)
+                batch_results = await loop.run_in_executor(
+                    self.executor, self._transcribe_batch,
+                    [chunks[i] for i in live],
+                    self.chunker.sample_rate, language, return_segments)
+                for i, result in zip(live, batch_results):
+                    start_time, end_time = timestamps[i]
+                    self._finalize_chunk_result(result, i, start_time,
+                                                end_time, return_segments)
+                    results[i] = result
+                    texts[i] = result.get("text", "")
+                completed = n
+                job_info["current_chunk"] = completed
+                job_info["progress"] = completed / n * 100
+                job_info["results"] = [r for r in results if r is not None]
+                await self._send_websocket_update(job_id)
+            else:
+                tasks = []
+                chunk_iter = self.chunker.iter_chunks(file_path)
+                for i, (start_time, end_time) in enumerate(timestamps):
+                    # Each next() decodes and resamples one chunk -
+                    # CPU-bound work that would starve the event loop
+                    # (and every WebSocket frame) if run inline
+                    chunk = await asyncio.to_thread(next, chunk_iter, None)
+                    if chunk is None:
+                        break
+                    if self._is_silent(chunk):
+                        # Skip enhancement and ASR entirely for silence
+                        results[i] = self._empty_result(i, start_time,
+                                                        end_time, return_segments)
+                        completed += 1
+                        job_info["current_chunk"] = completed
+                        job_info["progress"] = completed / n * 100
+                        job_info["results"] = [r for r in results if r is not None]
+                        await self._send_websocket_update(job_id)
+                        continue
+
+                    # Acquire before scheduling so at most max_concurrent
+                    # decoded chunks are in flight at once
+                    await sem.acquire()
+                    tasks.append(asyncio.create_task(
+                        _run_chunk(i, chunk, start_time, end_time)))
+                if tasks:
+                    await asyncio.gather(*tasks)
+
+            all_results = [r for r in results if r is not None]
+            job_info["full_text"] = " ".join(t for t in texts if t).strip()
+
             # Combine all segments if requested
             if return_segments:
                 all_segments = []
@@ -246,59 +479,110 @@ class StreamingProcessor:
             await self._send_websocket_update(job_id)
             print(f"Streaming processing failed: {e}")
     
-    def _process_single_chunk(self, chunk_path: str, language: str, return_segments: bool, 
-                             enhancement_options: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Process a single audio chunk with optional enhancement (runs in thread)"""
-        
-        processed_path = chunk_path
-        
+    def _is_silent(self, chunk: np.ndarray) -> bool:
+        """Cheap RMS gate: one vectorized pass, no ASR involvement"""
+        if self.silence_rms_threshold <= 0:
+            return False
+        rms = float(np.sqrt(np.mean(np.square(chunk, dtype=np.float32))))
+        return rms < self.silence_rms_threshold
+
+    def _empty_result(self, i: int, start_time: float, end_time: float,
+                      return_segments: bool) -> Dict[str, Any]:
+        """Placeholder for a silence-gated chunk with its real time range"""
+        result: Dict[str, Any] = {"text": ""}
+        if return_segments:
+            result["segments"] = []
+        return self._finalize_chunk_result(result, i, start_time, end_time,
+                                           return_segments)
+
+    @staticmethod
+    def _finalize_chunk_result(result: Dict[str, Any], i: int,
+                               start_time: float, end_time: float,
+                               return_segments: bool) -> Dict[str, Any]:
+        """Offset segment timestamps into file time and attach chunk info"""
+        if return_segments and result.get("segments"):
+            # The segment dicts are freshly built per chunk by the engine,
+            # so they can be offset in place; the adds happen as two
+            # vector ops instead of a Python loop per segment
+            segs = result["segments"]
+            starts = np.fromiter((s["start"] for s in segs),
+                                 dtype=np.float64, count=len(segs))
+            ends = np.fromiter((s["end"] for s in segs),
+                               dtype=np.float64, count=len(segs))
+            starts += start_time
+            ends += start_time
+            for seg, st, en in zip(segs, starts, ends):
+                seg["start"] = float(st)
+                seg["end"] = float(en)
+
+        result["chunk_info"] = {
+            "chunk_id": i,
+            "start_time": start_time,
+            "end_time": end_time,
+            "chunk_duration": end_time - start_time
+        }
+        return result
+
+    def _process_single_chunk_array(self, chunk: np.ndarray, sr: int, language: str,
+                                    return_segments: bool,
+                                    enhancement_options: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Process a single in-memory audio chunk with optional enhancement
+        (runs in thread)
+
+        The chunk stays a float32 numpy buffer end to end - enhancement
+        and transcription both consume arrays, so there is no per-chunk
+        encode/fsync/decode/unlink cycle.
+        """
         # Apply audio enhancement if requested
         if enhancement_options:
             enable_vad = enhancement_options.get("enable_vad", False)
             enable_noise_reduction = enhancement_options.get("enable_noise_reduction", False)
-            
+
             if enable_vad or enable_noise_reduction:
                 try:
-                    from audio_enhancement import enhance_audio_file
-                    processed_path = enhance_audio_file(
-                        input_path=chunk_path,
+                    from audio_enhancement import enhance_audio_array
+                    enhanced, enhanced_sr = enhance_audio_array(
+                        chunk, sr,
                         enable_vad=enable_vad,
                         enable_noise_reduction=enable_noise_reduction,
                         vad_aggressiveness=enhancement_options.get("vad_aggressiveness", 1),
                         noise_reduce_strength=enhancement_options.get("noise_reduce_strength", 0.6)
                     )
+                    if len(enhanced) > 0:
+                        chunk, sr = enhanced, enhanced_sr
                 except Exception as e:
                     print(f"Chunk enhancement failed: {e}, using original chunk")
-                    processed_path = chunk_path
-        
-        try:
-            # Transcribe the (possibly enhanced) chunk
-            result = self.asr_engine.transcribe(processed_path, language, return_segments)
-            
-            # Clean up enhanced chunk if different from original
-            if processed_path != chunk_path:
-                try:
-                    os.unlink(processed_path)
-                except:
-                    pass
-                    
-            return result
-            
-        except Exception as e:
-            # Clean up enhanced chunk on error
-            if processed_path != chunk_path:
-                try:
-                    os.unlink(processed_path)
-                except:
-                    pass
-            raise e
+
+        # Transcribe the (possibly enhanced) chunk
+        return self.asr_engine.transcribe_array(chunk, sr, language, return_segments)
     
+    # Cheap metadata returned by get_job_status; the heavy payload
+    # (full_text, results, segments) is only materialized on explicit
+    # get_job_results calls
+    _STATUS_KEYS = ("id", "status", "progress", "current_chunk",
+                    "total_chunks", "error")
+
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
-        """Get current job status"""
-        if job_id not in self.active_jobs:
+        """Get current job status (metadata only - poll-friendly)"""
+        job = self.active_jobs.get(job_id)
+        if job is None:
             return {"error": "Job not found"}
-        
-        return self.active_jobs[job_id].copy()
+
+        # error stays out of the dict while None so callers can keep
+        # treating its presence as "something went wrong"
+        return {k: job[k] for k in self._STATUS_KEYS
+                if k in job and job[k] is not None}
+
+    def get_job_results(self, job_id: str) -> Dict[str, Any]:
+        """Get the heavy result payload (full text, per-chunk results)"""
+        job = self.active_jobs.get(job_id)
+        if job is None:
+            return {"error": "Job not found"}
+
+        return {k: job[k] for k in ("id", "status", "full_text", "results",
+                                    "combined_segments", "timestamps")
+                if k in job}
     
     def cleanup_job(self, job_id: str) -> bool:
         """Clean up completed job"""
@@ -1,78 +1,88 @@
 # backend/subtitles.py
-from typing import List, Dict
+import functools
+from typing import Dict, Iterable, Iterator, List
 import re
 
+# Compiled once: per-segment re.sub with a string pattern pays a cache
+# lookup on every call
+_WS_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=4096)
+def _fmt(seconds: float, sep: str) -> str:
+    """HH:MM:SS<sep>mmm - shared core of the SRT/VTT formatters
+
+    Integer divmod: one float->int conversion instead of four
+    floating-point mod/floordiv rounds per segment. Boundary times
+    repeat across exports of the same transcript, so the LRU turns
+    repeat formatting into a dict hit.
+    """
+    ms = int(seconds * 1000)
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{sep}{ms:03d}"
+
 def format_timestamp_srt(seconds: float) -> str:
     """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+    return _fmt(seconds, ',')
 
 def format_timestamp_vtt(seconds: float) -> str:
     """Convert seconds to WebVTT timestamp format (HH:MM:SS.mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
+    return _fmt(seconds, '.')
 
-def segments_to_srt(segments: List[Dict]) -> str:
-    """Convert segments to SRT format"""
-    srt_content = []
-    
+def iter_srt(segments: Iterable[Dict]) -> Iterator[str]:
+    """Yield SRT entries one at a time (streaming-friendly)"""
     for i, segment in enumerate(segments, 1):
+        text = segment['text'].strip()
+
+        if not text:
+            continue
+
+        # Clean up text (remove extra whitespace, handle line breaks)
+        text = _WS_RE.sub(' ', text)
         start_time = format_timestamp_srt(segment['start'])
         end_time = format_timestamp_srt(segment['end'])
+
+        yield f"{i}\n{start_time} --> {end_time}\n{text}\n\n"
+
+def segments_to_srt(segments: List[Dict]) -> str:
+    """Convert segments to SRT format"""
+    return "".join(iter_srt(segments))
+
+def iter_vtt(segments: Iterable[Dict]) -> Iterator[str]:
+    """Yield WebVTT header and cues one at a time (streaming-friendly)"""
+    yield "WEBVTT\n\n"
+
+    for segment in segments:
         text = segment['text'].strip()
-        
+
         if not text:
             continue
-            
+
         # Clean up text (remove extra whitespace, handle line breaks)
-        text = re.sub(r'\s+', ' ', text)
-        
-        srt_content.append(f"{i}")
-        srt_content.append(f"{start_time} --> {end_time}")
-        srt_content.append(text)
-        srt_content.append("")  # Empty line between entries
-    
-    return "\n".join(srt_content)
+        text = _WS_RE.sub(' ', text)
+        start_time = format_timestamp_vtt(segment['start'])
+        end_time = format_timestamp_vtt(segment['end'])
+
+        yield f"{start_time} --> {end_time}\n{text}\n\n"
 
 def segments_to_vtt(segments: List[Dict]) -> str:
     """Convert segments to WebVTT format"""
-    vtt_content = ["WEBVTT", ""]
-    
+    return "".join(iter_vtt(segments))
+
+def iter_txt(segments: Iterable[Dict]) -> Iterator[str]:
+    """Yield timestamped text lines one at a time (streaming-friendly)"""
     for segment in segments:
-        start_time = format_timestamp_vtt(segment['start'])
-        end_time = format_timestamp_vtt(segment['end'])
         text = segment['text'].strip()
-        
+
         if not text:
             continue
-            
-        # Clean up text (remove extra whitespace, handle line breaks)
-        text = re.sub(r'\s+', ' ', text)
-        
-        vtt_content.append(f"{start_time} --> {end_time}")
-        vtt_content.append(text)
-        vtt_content.append("")  # Empty line between entries
-    
-    return "\n".join(vtt_content)
 
-def segments_to_txt(segments: List[Dict]) -> str:
-    """Convert segments to plain text with timestamps"""
-    txt_content = []
-    
-    for segment in segments:
         start_time = format_timestamp_srt(segment['start'])
         end_time = format_timestamp_srt(segment['end'])
-        text = segment['text'].strip()
-        
-        if not text:
-            continue
-            
-        txt_content.append(f"[{start_time} --> {end_time}] {text}")
-    
-    return "\n".join(txt_content)
\ No newline at end of file
+
+        yield f"[{start_time} --> {end_time}] {text}\n"
+
+def segments_to_txt(segments: List[Dict]) -> str:
+    """Convert segments to plain text with timestamps"""
+    return "".join(iter_txt(segments))
\ No newline at end of file
@@ -8,6 +8,10 @@ import tempfile
 import os
 from audio_enhancement import AudioEnhancer, enhance_audio_file
 
+# Seeded PCG64 generator: faster noise draws than the legacy global
+# RandomState, and deterministic test audio
+RNG = np.random.default_rng(0)
+
 def generate_test_audio():
     """Generate a simple test audio file"""
     # Generate 3 seconds of test audio: 1 second of noise, 1 second of tone, 1 second of noise
@@ -16,14 +20,14 @@ def generate_test_audio():
     samples = duration * sample_rate
     
     # Create audio with noise at beginning and end, tone in middle
-    audio = np.random.normal(0, 0.05, samples)  # Background noise
+    audio = RNG.standard_normal(samples) * 0.05  # Background noise
     
     # Add a tone in the middle second (1000 Hz)
     middle_start = sample_rate
     middle_end = sample_rate * 2
     t = np.linspace(0, 1, sample_rate)
     tone = 0.5 * np.sin(2 * np.pi * 1000 * t)  # 1000 Hz sine wave
-    audio[middle_start:middle_end] = tone + np.random.normal(0, 0.02, sample_rate)
+    audio[middle_start:middle_end] = tone + RNG.standard_normal(sample_rate) * 0.02
     
     # Save to temporary file
     with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
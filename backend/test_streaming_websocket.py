@@ -3,58 +3,183 @@
 Test streaming transcription with WebSocket updates
 """
 import asyncio
+import functools
+import io
 import websockets
-import requests
-import json
-import tempfile
 import numpy as np
 import soundfile as sf
-import time
 
-def generate_longer_audio():
-    """Generate a longer test audio file for streaming test"""
+from test_transcribe import post_multipart, RNG, SESSION, ne
+
+# orjson when available: Rust JSON parser, several times faster than
+# stdlib json in the progress recv loop
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# httpx when available: async upload that doesn't block the event loop,
+# so early progress frames are consumed while the POST is in flight
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+async def start_streaming_job(url, filename, fileobj, data):
+    """POST the upload without stalling the running event loop"""
+    if httpx is not None:
+        async with httpx.AsyncClient() as client:
+            return await client.post(
+                url,
+                files={'file': (filename, fileobj, 'audio/wav')},
+                data={k: str(v) for k, v in data.items()}
+            )
+    # Fallback: run the blocking requests upload in a worker thread
+    return await asyncio.to_thread(
+        post_multipart, url, (filename, fileobj, 'audio/wav'), data)
+
+# uvloop when available (Linux/macOS): faster socket I/O and callback
+# dispatch than the default selector loop
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# numba when available: LLVM-compiled synthesis, parallelized across
+# the five segments with prange and no temporaries in the inner loop.
+# Preferred over the numexpr/numpy paths below
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    import math
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _synth_segments(samples, sr):
+        audio = np.empty(samples, np.float32)
+        for i in prange(5):
+            s = i * sr * 2
+            e = min((i + 1) * sr * 2, samples)
+            f = 200.0 + i * 100.0
+            mf = 2.0 + i
+            for k in range(s, e):
+                tk = k / sr
+                p = 2.0 * math.pi * f * tk
+                m = 0.5 + 0.5 * math.sin(2.0 * math.pi * mf * tk)
+                audio[k] = (0.3 * math.sin(p) + 0.1 * math.sin(2.0 * p)) * m
+        return audio
+
+# picows when available: Cython frame parsing with no per-message
+# Future, several times faster than websockets on loopback
+try:
+    from picows import ws_connect, WSListener, WSMsgType
+except ImportError:
+    ws_connect = None
+
+if ws_connect is not None:
+    class _ProgressListener(WSListener):
+        """Push text frames into a queue for the test coroutine"""
+        def __init__(self):
+            self.queue = asyncio.Queue()
+
+        def on_ws_frame(self, transport, frame):
+            if frame.msg_type == WSMsgType.TEXT:
+                self.queue.put_nowait(frame.get_payload_as_ascii_text())
+
+async def connect_progress_ws(uri):
+    """
+    Connect to the progress WebSocket and return (recv, drain, aclose),
+    so the test body doesn't care which client library is underneath.
+    drain() returns every frame already queued without awaiting.
+    """
+    if ws_connect is not None:
+        transport, listener = await ws_connect(_ProgressListener, uri,
+                                               enable_auto_ping=False)
+
+        def drain():
+            frames = []
+            while True:
+                try:
+                    frames.append(listener.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    return frames
+
+        async def aclose():
+            transport.disconnect()
+
+        return listener.queue.get, drain, aclose
+
+    # compression=None: no permessage-deflate negotiation, so no zlib
+    # pass per frame - pure waste on loopback
+    ws = await websockets.connect(uri, compression=None, max_size=2**20)
+    # The websockets client has no non-blocking read, so there is
+    # nothing to drain - every frame goes through recv
+    return ws.recv, list, ws.close
+
+@functools.cache
+def _longer_wav_bytes() -> bytes:
+    """Synthesize the streaming test WAV once per process"""
     sample_rate = 16000
     duration = 10  # 10 seconds to test chunking
     samples = duration * sample_rate
     
-    t = np.linspace(0, duration, samples)
-    
-    # Create audio with different patterns in different sections
-    audio = np.zeros(samples)
-    
-    # Different frequency patterns for different time periods
-    for i in range(5):  # 5 different 2-second segments
-        start_idx = i * sample_rate * 2
-        end_idx = (i + 1) * sample_rate * 2
-        segment_t = t[start_idx:end_idx]
-        
-        # Different frequency for each segment
-        freq = 200 + i * 100
-        segment_audio = 0.3 * np.sin(2 * np.pi * freq * segment_t)
-        segment_audio += 0.1 * np.sin(2 * np.pi * freq * 2 * segment_t)
-        
-        # Add modulation
-        mod_freq = 2 + i
-        modulation = 0.5 + 0.5 * np.sin(2 * np.pi * mod_freq * segment_t)
-        segment_audio = segment_audio * modulation
-        
-        audio[start_idx:end_idx] = segment_audio
-    
+    # Create audio with different patterns in different sections: five
+    # 2-second segments, each with its own carrier and modulation
+    # frequency. float32 end to end: half the memory traffic and twice
+    # the SIMD lanes vs numpy's float64 default, and WAV output is
+    # PCM_16 anyway
+    if njit is not None:
+        audio = _synth_segments(samples, sample_rate)
+    else:
+        # Per-sample frequency arrays + broadcasting do the whole thing
+        # in one vectorized pass instead of a Python loop per segment
+        t = np.linspace(0, duration, samples, dtype=np.float32)
+        seg_samples = sample_rate * 2
+        freqs = np.repeat((np.arange(5) * 100 + 200).astype(np.float32),
+                          seg_samples)
+        mod_freqs = np.repeat((np.arange(5) + 2).astype(np.float32),
+                              seg_samples)
+
+        two_pi = np.float32(2 * np.pi)
+        phase = two_pi * freqs * t
+        mod_phase = two_pi * mod_freqs * t
+        if ne is not None:
+            # Fused single pass over the phase tables (numexpr threads
+            # across cores, no temporaries)
+            audio = ne.evaluate(
+                "(0.3*sin(phase) + 0.1*sin(2*phase)) * (0.5 + 0.5*sin(mod_phase))"
+            ).astype(np.float32)
+        else:
+            audio = (np.float32(0.3) * np.sin(phase)
+                     + np.float32(0.1) * np.sin(2 * phase)) \
+                * (np.float32(0.5) + np.float32(0.5) * np.sin(mod_phase))
+
     # Add some noise
-    audio += np.random.normal(0, 0.02, samples)
+    audio += RNG.standard_normal(samples, dtype=np.float32) * np.float32(0.02)
     
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-        sf.write(tmp.name, audio, sample_rate)
-        return tmp.name
+    # Quantize to int16 in one vectorized pass (the clip keeps noise
+    # peaks from wrapping at the int16 limits), then encode to an
+    # in-memory WAV: no temp file to create, reopen for upload and
+    # unlink afterwards
+    audio = np.clip(audio * np.float32(32767),
+                    -32768, 32767).astype(np.int16)
+    buf = io.BytesIO()
+    sf.write(buf, audio, sample_rate, format='WAV', subtype='PCM_16')
+    return buf.getvalue()
+
+def generate_longer_audio():
+    """Generate a longer test audio file for streaming test"""
+    return io.BytesIO(_longer_wav_bytes())
 
 async def test_streaming_with_websocket():
     """Test streaming transcription with WebSocket progress updates"""
     print("Generating longer test audio...")
-    test_file = generate_longer_audio()
-    
+    test_audio = generate_longer_audio()
+
     try:
-        print(f"Test audio file: {test_file}")
-        
         # Connect to WebSocket first
         client_id = "test_streaming_client"
         uri = f"ws://127.0.0.1:8765/ws/{client_id}"
@@ -64,29 +189,27 @@ async def test_streaming_with_websocket():
         messages_received = []
         job_id = None
         
-        async with websockets.connect(uri) as websocket:
+        recv, ws_drain, ws_close = await connect_progress_ws(uri)
+        try:
             print("WebSocket connected!")
-            
+
             # Start streaming transcription
             print("\nStarting streaming transcription...")
-            with open(test_file, 'rb') as f:
-                files = {'file': ('test_long.wav', f, 'audio/wav')}
-                data = {
-                    'language': 'ja',
-                    'format': 'text',
-                    'chunk_duration': 3,  # 3 second chunks
-                    'overlap_duration': 1,  # 1 second overlap
-                    'enable_vad': True,
-                    'enable_noise_reduction': True,
-                    'vad_aggressiveness': 1,
-                    'noise_reduce_strength': 0.6
-                }
-                
-                response = requests.post(
-                    'http://127.0.0.1:8765/transcribe/streaming', 
-                    files=files, 
-                    data=data
-                )
+            data = {
+                'language': 'ja',
+                'format': 'text',
+                'chunk_duration': 3,  # 3 second chunks
+                'overlap_duration': 1,  # 1 second overlap
+                'enable_vad': True,
+                'enable_noise_reduction': True,
+                'vad_aggressiveness': 1,
+                'noise_reduce_strength': 0.6
+            }
+
+            response = await start_streaming_job(
+                'http://127.0.0.1:8765/transcribe/streaming',
+                'test_long.wav', test_audio, data
+            )
             
             if response.status_code != 200:
                 print(f"❌ Failed to start streaming: {response.text}")
@@ -96,47 +219,62 @@ async def test_streaming_with_websocket():
             job_id = result.get('job_id')
             print(f"Streaming job started: {job_id}")
             
-            # Listen for WebSocket messages
+            # Listen for WebSocket messages under one outer deadline:
+            # a plain recv per frame instead of a wait_for task +
+            # timer created and cancelled every second
             print("\nListening for WebSocket progress updates...")
-            start_time = time.time()
-            timeout = 60  # 60 seconds timeout
-            
-            while time.time() - start_time < timeout:
-                try:
-                    # Wait for WebSocket message with timeout
-                    message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                    data = json.loads(message)
-                    messages_received.append(data)
-                    
-                    print(f"WebSocket message: {data}")
-                    
-                    if data.get('type') == 'progress_update' and data.get('job_id') == job_id:
-                        progress_data = data.get('data', {})
-                        status = progress_data.get('status')
-                        progress = progress_data.get('progress', 0)
-                        
-                        print(f"Progress: {progress:.1f}% - Status: {status}")
-                        
-                        if status == 'completed':
-                            print("✅ Streaming completed!")
-                            break
-                        elif status == 'failed':
-                            print(f"❌ Streaming failed: {progress_data.get('error')}")
-                            break
-                            
-                except asyncio.TimeoutError:
-                    # No message received, continue listening
-                    continue
-                except Exception as e:
-                    print(f"Error receiving WebSocket message: {e}")
-                    break
+            frames_seen = 0
+            last_status = None
+            try:
+                async with asyncio.timeout(60):
+                    while True:
+                        message = await recv()
+                        # Drain whatever queued up behind it: each
+                        # progress frame supersedes the previous one,
+                        # so only the newest needs parsing
+                        extras = ws_drain()
+                        frames_seen += 1 + len(extras)
+                        if extras:
+                            message = extras[-1]
+                        # Substring pre-filter: skip the JSON parse for
+                        # broadcasts about other clients' jobs
+                        if job_id not in message:
+                            continue
+                        data = json_loads(message)
+                        messages_received.append(data)
+
+                        if data.get('type') == 'progress_update' and data.get('job_id') == job_id:
+                            progress_data = data.get('data', {})
+                            status = progress_data.get('status')
+                            progress = progress_data.get('progress', 0)
+
+                            # Print on status changes and every 10th
+                            # parsed frame: a dict repr + synchronous
+                            # stdout write per frame can dominate the
+                            # recv loop during progress bursts
+                            if (status != last_status
+                                    or len(messages_received) % 10 == 0):
+                                print(f"Progress: {progress:.1f}% - Status: {status}")
+                                last_status = status
+
+                            if status == 'completed':
+                                print("✅ Streaming completed!")
+                                break
+                            elif status == 'failed':
+                                print(f"❌ Streaming failed: {progress_data.get('error')}")
+                                break
+            except TimeoutError:
+                print("⚠️ Timed out waiting for progress updates")
+            except Exception as e:
+                print(f"Error receiving WebSocket message: {e}")
             
-            print(f"\nReceived {len(messages_received)} WebSocket messages")
+            print(f"\nReceived {frames_seen} WebSocket frames "
+                  f"({len(messages_received)} parsed)")
             
             # Get final result
             if job_id:
                 print("\nFetching final result...")
-                final_response = requests.get(
+                final_response = SESSION.get(
                     f'http://127.0.0.1:8765/transcribe/streaming/{job_id}/result?format=text'
                 )
                 
@@ -146,18 +284,13 @@ async def test_streaming_with_websocket():
                     print("✅ Streaming with WebSocket test PASSED")
                 else:
                     print(f"❌ Failed to get final result: {final_response.text}")
-            
+        finally:
+            await ws_close()
+
     except Exception as e:
         print(f"❌ Streaming WebSocket test FAILED: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        # Cleanup
-        import os
-        try:
-            os.unlink(test_file)
-        except:
-            pass
 
 if __name__ == "__main__":
     asyncio.run(test_streaming_with_websocket())
\ No newline at end of file
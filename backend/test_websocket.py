@@ -6,22 +6,45 @@ import asyncio
 import websockets
 import json
 
+# orjson when available: Rust JSON parser, several times faster than
+# stdlib json for the message loop
+try:
+    import orjson
+    def _loads(s):
+        return orjson.loads(s)
+    def _dumps(obj):
+        # decode so the frame goes out as text, matching the server
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads, _dumps = json.loads, json.dumps
+
+# uvloop when available (Linux/macOS): faster socket I/O and callback
+# dispatch than the default selector loop
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 async def test_websocket():
     uri = "ws://127.0.0.1:8765/ws/test_client"
     
     try:
         print(f"Connecting to {uri}...")
-        async with websockets.connect(uri) as websocket:
+        # compression=None: no permessage-deflate negotiation, so no
+        # zlib pass per frame - pure waste on loopback
+        async with websockets.connect(uri, compression=None,
+                                      max_size=2**20) as websocket:
             print("Connected successfully!")
             
             # Send ping message
             ping_message = {"type": "ping"}
-            await websocket.send(json.dumps(ping_message))
+            await websocket.send(_dumps(ping_message))
             print("Sent ping message")
             
             # Wait for response
             response = await websocket.recv()
-            data = json.loads(response)
+            data = _loads(response)
             print(f"Received response: {data}")
             
             if data.get("type") == "pong":
@@ -537,10 +537,14 @@ function updateStreamingProgress(data) {
   }
   
   updateProgress(progress, statusText);
-  
-  if (data.full_text) {
+
+  if (data.full_text !== undefined) {
     $('out').value = data.full_text;
     lastResult = data.full_text;
+  } else if (data.text_delta) {
+    // Delta frame: the server only sent the newly appended text
+    lastResult = (lastResult || '') + data.text_delta;
+    $('out').value = lastResult;
   }
 }
 